@@ -2,12 +2,13 @@
 
 import enum
 import types
-import inspect
 import pathlib
 import datetime
+import typing as t
 import importlib.metadata
 
-import swf_typed
+if t.TYPE_CHECKING:
+    import sphinx.application
 
 project = "swf-typed"
 copyright = f"{datetime.date.today().year}, Laurie O"
@@ -29,22 +30,42 @@ autosummary_generate = False
 intersphinx_mapping = {'python': ('https://docs.python.org/3', None)}
 
 
-def _generate_api_docs() -> None:
-    source_dir = pathlib.Path(__file__).parent
-    swf_typed_exports = inspect.getmembers(
-        swf_typed, lambda x: not isinstance(x, types.ModuleType)
-    )
-    swf_typed_modules = inspect.getmembers(
-        swf_typed, lambda x: isinstance(x, types.ModuleType)
-    )
+def _write_text_if_changed(path: pathlib.Path, text: str) -> None:
+    # avoid bumping mtime, which makes Sphinx re-read unchanged sources
+    if not path.is_file() or path.read_text() != text:
+        path.write_text(text)
+
+
+def _get_type_name(export: object) -> str:
+    if isinstance(export, type):
+        if issubclass(export, Exception):
+            return "exception"
+        return "class"
+    elif isinstance(export, types.FunctionType):
+        return "function"
+    return "data"
+
+
+def _generate_api_docs(app: "sphinx.application.Sphinx") -> None:
+    import swf_typed
+
+    source_dir = pathlib.Path(app.srcdir)
+
+    swf_typed_modules = []
+    exports_by_module = {}
+    for name in dir(swf_typed):
+        member = getattr(swf_typed, name)
+        if isinstance(member, types.ModuleType):
+            swf_typed_modules.append((name, member))
+        else:
+            module_exports = exports_by_module.setdefault(
+                getattr(member, "__module__", None), []
+            )
+            module_exports.append((name, member, _get_type_name(member)))
 
     module_rst_references = []
     for module_name, module in swf_typed_modules:
-        exports_for_module = []
-        for name, export in swf_typed_exports:
-            if getattr(export, "__module__", None) == module.__name__:
-                exports_for_module.append((name, export))
-
+        exports_for_module = exports_by_module.get(module.__name__)
         if not exports_for_module:
             continue
 
@@ -61,30 +82,19 @@ def _generate_api_docs() -> None:
             "   :nosignatures:",
             "",
         ]
-        lines += [f"   {n}" for n, _ in exports_for_module]
-
-        for name, export in exports_for_module:
-            if isinstance(export, type):
-                if issubclass(export, Exception):
-                    type_name = "exception"
-                else:
-                    type_name = "class"
-            elif isinstance(export, types.FunctionType):
-                type_name = "function"
-            else:
-                type_name = "data"
-
-            lines += ["", f".. auto{type_name}:: {name}"]
+        lines.extend(f"   {n}" for n, _, _ in exports_for_module)
+
+        for name, export, type_name in exports_for_module:
+            lines.append("")
+            lines.append(f".. auto{type_name}:: {name}")
             if type_name == "class":
                 if not issubclass(export, enum.Enum):
-                    lines += ["   :inherited-members:"]
-                lines += [
-                    "   :members:",
-                    "   :undoc-members:",
-                ]
+                    lines.append("   :inherited-members:")
+                lines.append("   :members:")
+                lines.append("   :undoc-members:")
             elif type_name == "exception":
-                lines += ["   :members:"]
-            lines += [""]
+                lines.append("   :members:")
+            lines.append("")
 
         module_rst = "\n".join(lines)
 
@@ -92,8 +102,7 @@ def _generate_api_docs() -> None:
         module_rst_references.append(module_rst_reference)
 
         module_path = source_dir / f"{module_rst_reference}.rst"
-        if not module_path.is_file() or module_path.read_text() != module_rst:
-            module_path.write_text(module_rst)
+        _write_text_if_changed(module_path, module_rst)
 
     lines = [
         r"swf\_typed",
@@ -105,14 +114,15 @@ def _generate_api_docs() -> None:
         "   :maxdepth: 1",
         "",
     ]
-    lines += [f"   {n}" for n in module_rst_references]
-    lines += [""]
+    lines.extend(f"   {n}" for n in module_rst_references)
+    lines.append("")
 
     api_docs_rst = "\n".join(lines)
 
     api_docs_path = source_dir / f"swf_typed.rst"
-    if not api_docs_path.is_file() or api_docs_path.read_text() != api_docs_rst:
-        api_docs_path.write_text(api_docs_rst)
+    _write_text_if_changed(api_docs_path, api_docs_rst)
 
 
-_generate_api_docs()
+def setup(app: "sphinx.application.Sphinx") -> None:
+    # generate before sources are read, rather than on every conf.py load
+    app.connect("builder-inited", _generate_api_docs)
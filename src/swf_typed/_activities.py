@@ -11,11 +11,28 @@ from . import _common
 if t.TYPE_CHECKING:
     import botocore.client
 
+_default_task_configuration_keys = {
+    k: "default" + k[0].upper() + k[1:]
+    for k in (
+        "taskList",
+        "taskStartToCloseTimeout",
+        "taskScheduleToStartTimeout",
+        "taskScheduleToCloseTimeout",
+        "taskHeartbeatTimeout",
+        "taskPriority",
+    )
+}
+_task_configuration_keys_by_default_key = {
+    v: k for k, v in _default_task_configuration_keys.items()
+}
+
 
 @dataclasses.dataclass
 class ActivityId(_common.Deserialisable, _common.Serialisable):
     """Activity type identifier."""
 
+    __slots__ = ("name", "version")
+
     name: str
     """Activity name."""
 
@@ -65,18 +82,24 @@ class DefaultTaskConfiguration(_tasks.PartialTaskConfiguration):
 
     @classmethod
     def from_api(cls, data) -> "DefaultTaskConfiguration":
-        data = {k[7].lower() + k[8:]: v for k, v in data.items()}
+        data = {
+            k: data[default_k]
+            for default_k, k in _task_configuration_keys_by_default_key.items()
+            if default_k in data
+        }
         return super().from_api(data)
 
     def get_api_args(self):
         data = super().get_api_args()
-        return {"default" + k[0].upper() + k[1:]: v for k, v in data.items()}
+        return {_default_task_configuration_keys[k]: v for k, v in data.items()}
 
 
 @dataclasses.dataclass
 class ActivityDetails(_common.Deserialisable):
     """Activity type details and default activity task configuration."""
 
+    __slots__ = ("info", "default_task_configuration")
+
     info: ActivityInfo
     """Activity details."""
 
@@ -95,6 +118,8 @@ class ActivityDetails(_common.Deserialisable):
 class ActivityIdFilter(_common.SerialisableToArguments):
     """Activity type filter on activity name."""
 
+    __slots__ = ("name",)
+
     name: str
     """Activity name."""
 
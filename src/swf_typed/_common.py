@@ -1,9 +1,10 @@
 """Common models and methods."""
 
+import os
 import abc
 import socket
 import datetime
-import contextlib
+import threading
 import typing as t
 import concurrent.futures
 
@@ -19,6 +20,31 @@ registration_status_by_is_deprecated = {
     v: k for k, v in is_deprecated_by_registration_status.items()
 }
 
+executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="swf-typed")
+"""Executor for background retrieval of next pages of paginated results."""
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """Replace process-bound state inherited by a forked child process."""
+    global executor
+    global _default_client
+    global _default_client_lock
+
+    # the parent's worker threads don't exist in the child
+    executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="swf-typed")
+
+    # clients (and their connection pools) mustn't be shared across processes,
+    # and the lock may have been held by another thread at fork
+    _default_client = None
+    _default_client_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 class _Sentinel:
     """Not-provided value sentinel."""
@@ -39,6 +65,8 @@ unset = _Sentinel()
 class Deserialisable(metaclass=abc.ABCMeta):
     """Deserialisable from SWF API response data."""
 
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     def from_api(cls, data: t.Dict[str, t.Any]) -> "Deserialisable":
@@ -48,6 +76,8 @@ class Deserialisable(metaclass=abc.ABCMeta):
 class Serialisable(metaclass=abc.ABCMeta):
     """Serialisable to SWF API request data."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def to_api(self) -> t.Dict[str, t.Any]:
         """Serialise to SWF API request data."""
@@ -56,24 +86,35 @@ class Serialisable(metaclass=abc.ABCMeta):
 class SerialisableToArguments(metaclass=abc.ABCMeta):
     """Serialisable to SWF API request arguments."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def get_api_args(self) -> t.Dict[str, t.Any]:
         """Serialise to SWF API request arguments."""
 
 
+def _get_default_client() -> "botocore.client.BaseClient":
+    """Get default SWF client, creating it on first call."""
+    global _default_client
+
+    with _default_client_lock:
+        if _default_client is None:
+            import boto3
+
+            client = boto3.client("swf")
+            _exceptions.redirect_exceptions_in_swf_client(client)
+            _default_client = client
+    return _default_client
+
+
 def ensure_client(
     client: "botocore.client.BaseClient" = None,
 ) -> "botocore.client.BaseClient":
-    """Return or create SWF client."""
+    """Return SWF client, or default client if not provided."""
     if client:
         _exceptions.redirect_exceptions_in_swf_client(client)
         return client
-
-    import boto3
-
-    client = boto3.client("swf")
-    _exceptions.redirect_exceptions_in_swf_client(client)
-    return client
+    return _default_client or _get_default_client()
 
 
 def parse_timeout(timeout_data: str) -> t.Union[datetime.timedelta, None]:
@@ -95,45 +136,66 @@ def iter_paged(
     call: t.Callable[..., t.Dict[str, t.Any]],
     model: t.Callable[[t.Dict[str, t.Any]], T],
     data_key: str,
+    response: t.Dict[str, t.Any] = None,
 ) -> t.Generator[T, None, None]:
     """Yield results from paginated method.
 
-    Method is called immediately, then a generator is returned which yields
-    results. If a pagination token is found in the response, retrieval of
-    the next page is immediately scheduled (called in another thread).
-    Further pages are not scheduled until the current page is consumed.
+    Method is called immediately (unless the first page's response is
+    provided), then a generator is returned which yields results. If a
+    pagination token is found in the response, retrieval and transformation
+    of the next page is immediately scheduled (called in the shared
+    background-thread executor). Further pages are not scheduled until the
+    current page is consumed, as each page request requires the previous
+    page's pagination token.
 
     Args:
         call: paginated method
         model: transform results (eg into data model)
         data_key: response results key
+        response: first page's response, default: call method
 
     Returns:
         method results, transformed
     """
 
+    def get_page(**kwargs) -> t.Tuple[t.Union[str, None], t.List[T]]:
+        page_response = call(**kwargs)
+        items = [model(d) for d in page_response.get(data_key) or []]
+        return page_response.get("nextPageToken"), items
+
     def iter_() -> t.Generator[T, None, None]:
-        nonlocal response
+        next_page_token = response.get("nextPageToken")
+        items = map(model, response.get(data_key) or [])
+        while next_page_token:
+            future = executor.submit(get_page, nextPageToken=next_page_token)
+            yield from items
+            next_page_token, items = future.result()
+        yield from items
+
+    if response is None:
+        response = call()
+    return iter_()
 
-        while response.get("nextPageToken"):
-            future = executor.submit(call, nextPageToken=response["nextPageToken"])
-            yield from (model(d) for d in response.get(data_key) or [])
-            response = future.result()
-        yield from (model(d) for d in response.get(data_key) or [])
 
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-    response = call()
-    return iter_()
+class _PollingSocketTimeout:
+    """Socket timeout setting context manager."""
+
+    __slots__ = ("timeout_seconds", "_original_timeout_seconds")
+
+    def __init__(self, timeout: datetime.timedelta):
+        self.timeout_seconds = timeout.total_seconds()
+        self._original_timeout_seconds = None
+
+    def __enter__(self) -> None:
+        self._original_timeout_seconds = socket.getdefaulttimeout()
+        socket.setdefaulttimeout(self.timeout_seconds)
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        socket.setdefaulttimeout(self._original_timeout_seconds)
 
 
-@contextlib.contextmanager
 def polling_socket_timeout(
     timeout: datetime.timedelta = datetime.timedelta(seconds=70),
-) -> None:
+) -> t.ContextManager[None]:
     """Set socket timeout for polling in a context."""
-    original_timeout_seconds = socket.getdefaulttimeout()
-    socket.setdefaulttimeout(timeout.total_seconds())
-    try:
-        yield
-    finally:
-        socket.setdefaulttimeout(original_timeout_seconds)
+    return _PollingSocketTimeout(timeout)
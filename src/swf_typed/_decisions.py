@@ -1,6 +1,5 @@
 """SWF decision task management."""
 
-import abc
 import datetime
 import warnings
 import functools
@@ -19,28 +18,28 @@ if t.TYPE_CHECKING:
 
 
 @dataclasses.dataclass
-class Decision(_common.Serialisable, metaclass=abc.ABCMeta):
+class Decision(_common.Serialisable):
     """Decider decision."""
 
+    __slots__ = ()
+
     type: t.ClassVar[str]
     """Decision type name."""
 
-    @abc.abstractmethod
-    def to_api(self):
-        return {"decisionType": self.type}
-
 
 @dataclasses.dataclass
 class CancelTimerDecision(Decision):
     """Cancel timer decider decision."""
 
+    __slots__ = ("timer_id",)
+
     type: t.ClassVar[str] = "CancelTimer"
 
     timer_id: str
     """Timer ID."""
 
     def to_api(self):
-        data = super().to_api()
+        data = {"decisionType": self.type}
         data["cancelTimerDecisionAttributes"] = {"timerId": self.timer_id}
         return data
 
@@ -55,11 +54,10 @@ class CancelWorkflowExecutionDecision(Decision):
     """Execution cancellation details, usually for explanation."""
 
     def to_api(self):
-        data = super().to_api()
-        if self.details or self.details == "":
-            data["cancelWorkflowExecutionDecisionAttributes"] = {
-                "details": self.details
-            }
+        data = {"decisionType": self.type}
+        details = self.details
+        if details is not None:
+            data["cancelWorkflowExecutionDecisionAttributes"] = {"details": details}
         return data
 
 
@@ -73,10 +71,11 @@ class CompleteWorkflowExecutionDecision(Decision):
     """Execution result."""
 
     def to_api(self):
-        data = super().to_api()
-        if self.execution_result or self.execution_result == "":
+        data = {"decisionType": self.type}
+        execution_result = self.execution_result
+        if execution_result is not None:
             data["completeWorkflowExecutionDecisionAttributes"] = {
-                "result": self.execution_result,
+                "result": execution_result,
             }
         return data
 
@@ -100,22 +99,28 @@ class ContinueAsNewWorkflowExecutionDecision(Decision):
     """Continuing execution tags."""
 
     def to_api(self):
-        data = super().to_api()
-        attr_key = "continueAsNewWorkflowExecutionDecisionAttributes"
+        data = {"decisionType": self.type}
+        decision_attributes = {}
 
-        if self.execution_input or self.execution_input == "":
-            data.setdefault(attr_key, {})["input"] = self.execution_input
+        execution_input = self.execution_input
+        if execution_input is not None:
+            decision_attributes["input"] = execution_input
 
-        if self.workflow_version or self.workflow_version == "":
-            data.setdefault(attr_key, {})["workflowTypeVersion"] = self.workflow_version
+        workflow_version = self.workflow_version
+        if workflow_version is not None:
+            decision_attributes["workflowTypeVersion"] = workflow_version
 
-        if self.execution_configuration:
-            execution_configuration_data = self.execution_configuration.get_api_args()
-            data.setdefault(attr_key, {}).update(execution_configuration_data)
+        execution_configuration = self.execution_configuration
+        if execution_configuration:
+            decision_attributes.update(execution_configuration.get_api_args())
 
-        if self.tags or self.tags == []:
-            data.setdefault(attr_key, {})["tagList"] = self.tags
+        tags = self.tags
+        if tags is not None:
+            decision_attributes["tagList"] = tags
 
+        if decision_attributes:
+            attr_key = "continueAsNewWorkflowExecutionDecisionAttributes"
+            data[attr_key] = decision_attributes
         return data
 
 
@@ -132,14 +137,16 @@ class FailWorkflowExecutionDecision(Decision):
     """Execution failure details, usually for explanation."""
 
     def to_api(self):
-        data = super().to_api()
+        data = {"decisionType": self.type}
 
-        if self.reason or self.details:
+        reason = self.reason
+        details = self.details
+        if reason or details:
             data["failWorkflowExecutionDecisionAttributes"] = decision_attributes = {}
-            if self.reason or self.reason == "":
-                decision_attributes["reason"] = self.reason
-            if self.details or self.details == "":
-                decision_attributes["details"] = self.details
+            if reason is not None:
+                decision_attributes["reason"] = reason
+            if details is not None:
+                decision_attributes["details"] = details
 
         return data
 
@@ -157,10 +164,13 @@ class RecordMarkerDecision(Decision):
     """Attached marker data."""
 
     def to_api(self):
-        data = super().to_api()
-        data["recordMarkerDecisionAttributes"] = {"markerName": self.marker_name}
-        if self.details or self.details == "":
-            data["recordMarkerDecisionAttributes"]["details"] = self.details
+        data = {"decisionType": self.type}
+        data["recordMarkerDecisionAttributes"] = decision_attributes = {
+            "markerName": self.marker_name,
+        }
+        details = self.details
+        if details is not None:
+            decision_attributes["details"] = details
         return data
 
 
@@ -168,13 +178,15 @@ class RecordMarkerDecision(Decision):
 class RequestCancelActivityTaskDecision(Decision):
     """Cancel activity task request decider decision."""
 
+    __slots__ = ("task_id",)
+
     type: t.ClassVar[str] = "RequestCancelActivityTask"
 
     task_id: str
     """ID of task to cancel."""
 
     def to_api(self):
-        data = super().to_api()
+        data = {"decisionType": self.type}
         data["requestCancelActivityTaskDecisionAttributes"] = {
             "activityId": self.task_id,
         }
@@ -194,11 +206,12 @@ class RequestCancelExternalWorkflowExecutionDecision(Decision):
     """Message for future deciders."""
 
     def to_api(self):
-        data = super().to_api()
+        data = {"decisionType": self.type}
         attr_key = "requestCancelExternalWorkflowExecutionDecisionAttributes"
-        data[attr_key] = self.execution.to_api()
-        if self.control or self.control == "":
-            data[attr_key]["control"] = self.control
+        data[attr_key] = decision_attributes = self.execution.to_api()
+        control = self.control
+        if control is not None:
+            decision_attributes["control"] = control
         return data
 
 
@@ -224,21 +237,23 @@ class ScheduleActivityTaskDecision(Decision):
     """Message for future deciders."""
 
     def to_api(self):
-        data = super().to_api()
+        data = {"decisionType": self.type}
         data["scheduleActivityTaskDecisionAttributes"] = decision_attributes = {
             "activityType": self.activity.to_api(),
             "activityId": self.task_id,
         }
 
-        if self.task_input or self.task_input == "":
-            decision_attributes["input"] = self.task_input
+        task_input = self.task_input
+        if task_input is not None:
+            decision_attributes["input"] = task_input
 
-        if self.control or self.control == "":
-            decision_attributes["control"] = self.control
+        control = self.control
+        if control is not None:
+            decision_attributes["control"] = control
 
-        if self.task_configuration:
-            task_configuration_data = self.task_configuration.get_api_args()
-            decision_attributes.update(task_configuration_data)
+        task_configuration = self.task_configuration
+        if task_configuration:
+            decision_attributes.update(task_configuration.get_api_args())
 
         return data
 
@@ -265,21 +280,24 @@ class ScheduleLambdaFunctionDecision(Decision):
     """Message for future deciders."""
 
     def to_api(self):
-        data = super().to_api()
+        data = {"decisionType": self.type}
         data["scheduleLambdaFunctionDecisionAttributes"] = decision_attributes = {
             "lambda": self.lambda_function,
             "id": self.task_id,
         }
 
-        if self.task_input or self.task_input == "":
-            decision_attributes["input"] = self.task_input
+        task_input = self.task_input
+        if task_input is not None:
+            decision_attributes["input"] = task_input
 
-        if self.control or self.control == "":
-            decision_attributes["control"] = self.control
+        control = self.control
+        if control is not None:
+            decision_attributes["control"] = control
 
-        if self.task_timeout or self.task_timeout == datetime.timedelta(0):
+        task_timeout = self.task_timeout
+        if task_timeout or task_timeout == datetime.timedelta(0):
             decision_attributes["startToCloseTimeout"] = str(
-                int(self.task_timeout.total_seconds())
+                int(task_timeout.total_seconds())
             )
 
         return data
@@ -304,14 +322,16 @@ class SignalExternalWorkflowExecutionDecision(Decision):
     """Message for future deciders."""
 
     def to_api(self):
-        data = super().to_api()
+        data = {"decisionType": self.type}
         attr_key = "signalExternalWorkflowExecutionDecisionAttributes"
-        data[attr_key] = self.execution.to_api()
-        data[attr_key]["signalName"] = self.signal
-        if self.signal_input or self.signal_input == "":
-            data[attr_key]["input"] = self.signal_input
-        if self.control or self.control == "":
-            data[attr_key]["control"] = self.control
+        data[attr_key] = decision_attributes = self.execution.to_api()
+        decision_attributes["signalName"] = self.signal
+        signal_input = self.signal_input
+        if signal_input is not None:
+            decision_attributes["input"] = signal_input
+        control = self.control
+        if control is not None:
+            decision_attributes["control"] = control
         return data
 
 
@@ -340,23 +360,27 @@ class StartChildWorkflowExecutionDecision(Decision):
     """Message for future deciders."""
 
     def to_api(self):
-        data = super().to_api()
+        data = {"decisionType": self.type}
         data["startChildWorkflowExecutionDecisionAttributes"] = decision_attributes = {
             "workflowType": self.workflow.to_api(),
             "workflowId": self.execution.id,
         }
 
-        if self.execution_input or self.execution_input == "":
-            decision_attributes["input"] = self.execution_input
+        execution_input = self.execution_input
+        if execution_input is not None:
+            decision_attributes["input"] = execution_input
 
-        if self.execution_configuration:
-            decision_attributes.update(self.execution_configuration.get_api_args())
+        execution_configuration = self.execution_configuration
+        if execution_configuration:
+            decision_attributes.update(execution_configuration.get_api_args())
 
-        if self.control or self.control == "":
-            decision_attributes["control"] = self.control
+        control = self.control
+        if control is not None:
+            decision_attributes["control"] = control
 
-        if self.tags or self.tags == []:
-            decision_attributes["tagList"] = self.tags
+        tags = self.tags
+        if tags is not None:
+            decision_attributes["tagList"] = tags
 
         return data
 
@@ -377,13 +401,14 @@ class StartTimerDecision(Decision):
     """Message for future deciders."""
 
     def to_api(self):
-        data = super().to_api()
-        data["startTimerDecisionAttributes"] = {
+        data = {"decisionType": self.type}
+        data["startTimerDecisionAttributes"] = decision_attributes = {
             "timerId": self.timer_id,
             "startToFireTimeout": str(int(self.timer_duration.total_seconds())),
         }
-        if self.control or self.control == "":
-            data["startTimerDecisionAttributes"]["control"] = self.control
+        control = self.control
+        if control is not None:
+            decision_attributes["control"] = control
         return data
 
 
@@ -456,7 +481,7 @@ class DecisionTask(_common.Deserialisable):
     @property
     def execution_history(self) -> t.List["_history.Event"]:
         """Execution history events."""
-        self._execution_history_list += list(self._execution_history_iter)
+        self._execution_history_list.extend(self._execution_history_iter)
         return self._execution_history_list
 
 
@@ -511,14 +536,6 @@ def request_decision_task(
 
     from . import _history
 
-    def iter_history() -> t.Generator["_history.Event", None, None]:
-        r = response
-        while r.get("nextPageToken"):
-            future = _common.executor.submit(call, nextPageToken=r["nextPageToken"])
-            yield from (_history.Event.from_api(d) for d in r.get("events") or [])
-            r = future.result()
-        yield from (_history.Event.from_api(d) for d in r.get("events") or [])
-
     client = _common.ensure_client(client)
     kw = {}
     if decider_identity or decider_identity == "":
@@ -535,7 +552,10 @@ def request_decision_task(
             if response["taskToken"]:
                 break
             no_tasks_callback()
-    return DecisionTask.from_api(response, iter_history())
+    execution_history_iter = _common.iter_paged(
+        call, _history.Event.from_api, "events", response
+    )
+    return DecisionTask.from_api(response, execution_history_iter)
 
 
 def send_decisions(
@@ -557,7 +577,6 @@ def send_decisions(
     kw = {}
     if context or context == "":
         kw["executonContext"] = context
-    decisions_data = [d.to_api() for d in decisions]
     client.respond_decision_task_completed(
-        taskToken=token, decisions=decisions_data, **kw
+        taskToken=token, decisions=[d.to_api() for d in decisions], **kw
     )
@@ -70,6 +70,11 @@ class DomainDetails(_common.Deserialisable):
         )
 
 
+def _tags_to_api(tags: t.Dict[str, str]) -> t.List[t.Dict[str, str]]:
+    """Serialise resource tags to SWF API request data."""
+    return [{"key": k, "value": v} for k, v in tags.items()]
+
+
 def deprecate_domain(
     domain: str,
     client: "botocore.client.BaseClient" = None,
@@ -170,7 +175,7 @@ def register_domain(
     if description or description == "":
         kw["description"] = description
     if tags:
-        kw["tags"] = [dict(key=k, value=v) for k, v in tags.items()]
+        kw["tags"] = _tags_to_api(tags)
     execution_retention_data = str(configuration.execution_retention.days)
     client.register_domain(
         name=domain,
@@ -193,8 +198,7 @@ def tag_domain(
     """
 
     client = _common.ensure_client(client)
-    tags = [dict(key=k, value=v) for k, v in tags.items()]
-    client.tag_resource(resourceArn=domain_arn, tags=tags)
+    client.tag_resource(resourceArn=domain_arn, tags=_tags_to_api(tags))
 
 
 def undeprecate_domain(
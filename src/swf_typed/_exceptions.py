@@ -50,14 +50,7 @@ _swf_client_methods = (
     "undeprecate_workflow_type",
     "untag_resource",
 )
-_pass_through_exceptions = (
-    "IncompleteSignature",
-    "InvalidAction",
-    "InvalidQueryParameter",
-    "MalformedQueryString",
-    "MissingAuthenticationToken",
-    "MissingParameter",
-)
+_redirected_flag_attribute = "_swf_typed_exceptions_redirected"
 
 
 class SwfError(Exception):
@@ -223,7 +216,7 @@ class ExceptionRedirectMethodWrapper(t.Generic[T]):
         try:
             return self._f(*args, **kwargs)
         except botocore.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] in _pass_through_exceptions:
+            if e.response["Error"]["Code"] not in SwfError._child_classes:
                 raise
             raise SwfError.from_botocore_exception(e) from None
 
@@ -234,11 +227,17 @@ class ExceptionRedirectMethodWrapper(t.Generic[T]):
 def redirect_exceptions_in_swf_client(swf_client: "botocore.client.BaseClient") -> None:
     """Redirect ``botocore`` client-error exceptions to custom exceptions.
 
+    Does nothing if exceptions are already redirected in the client.
+
     Args:
         swf_client: client to redirect exceptions from, modified in-place
     """
 
+    if getattr(swf_client, _redirected_flag_attribute, False):
+        return
+
     for name in _swf_client_methods:
         attr = getattr(swf_client, name)
         attr = ExceptionRedirectMethodWrapper(attr)
         setattr(swf_client, name, attr)
+    setattr(swf_client, _redirected_flag_attribute, True)
@@ -21,6 +21,8 @@ default_executions_list_time_range = datetime.timedelta(days=90)
 class CurrentExecutionId(_common.Deserialisable, _common.Serialisable):
     """Current open workflow execution specifier."""
 
+    __slots__ = ("id",)
+
     id: str
     """Execution workflow-ID."""
 
@@ -36,6 +38,8 @@ class CurrentExecutionId(_common.Deserialisable, _common.Serialisable):
 class ExecutionId(CurrentExecutionId):
     """Workflow execution identifier."""
 
+    __slots__ = ("run_id",)
+
     run_id: str
     """Execution run-ID."""
 
@@ -44,9 +48,7 @@ class ExecutionId(CurrentExecutionId):
         return cls(id=data["workflowId"], run_id=data["runId"])
 
     def to_api(self):
-        data = super().to_api()
-        data["runId"] = self.run_id
-        return data
+        return {"workflowId": self.id, "runId": self.run_id}
 
 
 class ExecutionStatus(enum.Enum):
@@ -77,6 +79,9 @@ class ExecutionStatus(enum.Enum):
     """Execution has timed out."""
 
 
+_execution_statuses_by_value = {s.value: s for s in ExecutionStatus}
+
+
 @dataclasses.dataclass
 class ExecutionInfo(_common.Deserialisable):
     """Workflow execution details."""
@@ -112,14 +117,19 @@ class ExecutionInfo(_common.Deserialisable):
         status_data = data["executionStatus"]
         if status_data == "CLOSED":
             status_data = data["closeStatus"]
+        status = (
+            _execution_statuses_by_value.get(status_data) or
+            ExecutionStatus(status_data)
+        )
+        parent_data = data.get("parent")
         return cls(
             execution=ExecutionId.from_api(data["execution"]),
             workflow=_workflows.WorkflowId.from_api(data["workflowType"]),
             started=data["startTimestamp"],
-            status=ExecutionStatus(status_data),
+            status=status,
             cancel_requested=data["cancelRequested"],
             closed=data.get("closeTimestamp"),
-            parent=data.get("parent") and ExecutionId.from_api(data["parent"]),
+            parent=parent_data and ExecutionId.from_api(parent_data),
             tags=data.get("tagList"),
         )
 
@@ -137,6 +147,11 @@ class ChildExecutionTerminationPolicy(str, enum.Enum):
     """Abandon child executions."""
 
 
+_child_execution_termination_policies_by_value = {
+    p.value: p for p in ChildExecutionTerminationPolicy
+}
+
+
 @dataclasses.dataclass
 class ExecutionConfiguration(_common.Deserialisable):
     """Workflow execution configuration."""
@@ -161,14 +176,19 @@ class ExecutionConfiguration(_common.Deserialisable):
 
     @classmethod
     def from_api(cls, data) -> "ExecutionConfiguration":
-        child_policy = ChildExecutionTerminationPolicy(data["childPolicy"])
+        child_policy_data = data["childPolicy"]
+        child_policy = (
+            _child_execution_termination_policies_by_value.get(child_policy_data) or
+            ChildExecutionTerminationPolicy(child_policy_data)
+        )
         decision_task_timeout = _common.parse_timeout(data["taskStartToCloseTimeout"])
+        decision_task_priority_data = data.get("taskPriority")
         return cls(
             timeout=_common.parse_timeout(data["executionStartToCloseTimeout"]),
             decision_task_timeout=decision_task_timeout,
             decision_task_list=data["taskList"]["name"],
             decision_task_priority=(
-                data.get("taskPriority") and int(data["taskPriority"])
+                decision_task_priority_data and int(decision_task_priority_data)
             ),
             child_execution_policy_on_termination=child_policy,
             lambda_iam_role_arn=data.get("lambdaRole"),
@@ -189,34 +209,38 @@ class PartialExecutionConfiguration(
 
     @classmethod
     def from_api(cls, data) -> "PartialExecutionConfiguration":
+        timeout_data = data.get("executionStartToCloseTimeout")
+        decision_task_timeout_data = data.get("taskStartToCloseTimeout")
+        decision_task_list_data = data.get("taskList")
+        decision_task_priority_data = data.get("taskPriority")
+        child_policy_data = data.get("childPolicy")
+        child_policy = child_policy_data and (
+            _child_execution_termination_policies_by_value.get(child_policy_data) or
+            ChildExecutionTerminationPolicy(child_policy_data)
+        )
         return cls(
-            timeout=(
-                data.get("executionStartToCloseTimeout") and
-                _common.parse_timeout(data["executionStartToCloseTimeout"])
-            ),
+            timeout=timeout_data and _common.parse_timeout(timeout_data),
             decision_task_timeout=(
-                data.get("taskStartToCloseTimeout") and
-                _common.parse_timeout(data["taskStartToCloseTimeout"])
+                decision_task_timeout_data and
+                _common.parse_timeout(decision_task_timeout_data)
             ),
-            decision_task_list=data.get("taskList") and data["taskList"]["name"],
-            decision_task_priority=(
-                data.get("taskPriority") and int(data["taskPriority"])
+            decision_task_list=(
+                decision_task_list_data and decision_task_list_data["name"]
             ),
-            child_execution_policy_on_termination=(
-                data.get("childPolicy") and
-                ChildExecutionTerminationPolicy(data["childPolicy"])
+            decision_task_priority=(
+                decision_task_priority_data and int(decision_task_priority_data)
             ),
+            child_execution_policy_on_termination=child_policy,
             lambda_iam_role_arn=data.get("lambdaRole"),
         )
 
     def get_api_args(self):
         data = {}
 
-        if self.timeout or self.timeout == datetime.timedelta(0):
-            data["executionStartToCloseTimeout"] = str(
-                int(self.timeout.total_seconds())
-            )
-        elif self.timeout is None:
+        timeout = self.timeout
+        if timeout or timeout == datetime.timedelta(0):
+            data["executionStartToCloseTimeout"] = str(int(timeout.total_seconds()))
+        elif timeout is None:
             data["executionStartToCloseTimeout"] = "NONE"
 
         decision_task_timeout = self.decision_task_timeout
@@ -227,17 +251,21 @@ class PartialExecutionConfiguration(
         elif decision_task_timeout is None:
             data["taskStartToCloseTimeout"] = "NONE"
 
-        if self.decision_task_list or self.decision_task_list == "":
-            data["taskList"] = {"name": self.decision_task_list}
+        decision_task_list = self.decision_task_list
+        if decision_task_list or decision_task_list == "":
+            data["taskList"] = {"name": decision_task_list}
 
-        if self.decision_task_priority or self.decision_task_priority == 0:
-            data["taskPriority"] = str(self.decision_task_priority)
+        decision_task_priority = self.decision_task_priority
+        if decision_task_priority or decision_task_priority == 0:
+            data["taskPriority"] = str(decision_task_priority)
 
-        if self.child_execution_policy_on_termination:
-            data["childPolicy"] = self.child_execution_policy_on_termination.value
+        child_policy = self.child_execution_policy_on_termination
+        if child_policy:
+            data["childPolicy"] = child_policy.value
 
-        if self.lambda_iam_role_arn or self.lambda_iam_role_arn == "":
-            data["lambdaRole"] = self.lambda_iam_role_arn
+        lambda_iam_role_arn = self.lambda_iam_role_arn
+        if lambda_iam_role_arn or lambda_iam_role_arn == "":
+            data["lambdaRole"] = lambda_iam_role_arn
 
         return data
 
@@ -606,12 +634,7 @@ def request_cancel_execution(
     """
 
     client = _common.ensure_client(client)
-    kw = {}
-    if isinstance(execution, ExecutionId):
-        kw["runId"] = execution.run_id
-    client.request_cancel_workflow_execution(
-        domain=domain, workflowId=execution.id, **kw
-    )
+    client.request_cancel_workflow_execution(domain=domain, **execution.to_api())
 
 
 def signal_execution(
@@ -632,17 +655,10 @@ def signal_execution(
     """
 
     client = _common.ensure_client(client)
-    kw = {}
-    if isinstance(execution, ExecutionId):
-        kw["runId"] = execution.run_id
+    kw = execution.to_api()
     if input_ or input_ == "":
         kw["input"] = input_
-    client.request_cancel_workflow_execution(
-        domain=domain,
-        workflowId=execution.id,
-        signalName=signal,
-        **kw,
-    )
+    client.signal_workflow_execution(domain=domain, signalName=signal, **kw)
 
 
 def start_execution(
@@ -707,17 +723,11 @@ def terminate_execution(
     """
 
     client = _common.ensure_client(client)
-    kw = {}
-    if isinstance(execution, ExecutionId):
-        kw["runId"] = execution.run_id
+    kw = execution.to_api()
     if reason or reason == "":
         kw["reason"] = reason
     if details or details == "":
         kw["details"] = details
     if child_execution_policy:
         kw["childPolicy"] = child_execution_policy.value
-    client.terminate_workflow_execution(
-        domain=domain,
-        workflowId=execution.id,
-        **kw,
-    )
+    client.terminate_workflow_execution(domain=domain, **kw)
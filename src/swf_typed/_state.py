@@ -5,12 +5,13 @@ import datetime
 import dataclasses
 import typing as t
 
+from . import _executions
+
 if t.TYPE_CHECKING:
     from . import _tasks
     from . import _history
     from . import _workflows
     from . import _activities
-    from . import _executions
 
 
 class TaskStatus(enum.Enum):
@@ -324,15 +325,25 @@ class _StateBuilder:
     execution_history: t.Iterable["_history.Event"]
     execution: ExecutionState
     _tasks: t.Dict[int, t.Union[TaskState, LambdaTaskState]]
+    _tasks_by_id: t.Dict[str, TaskState]
     _child_executions: t.Dict[int, ChildExecutionState]
-    _child_execution_initiation_events: t.List[
-        "_history.StartChildWorkflowExecutionInitiatedEvent"
+    _child_execution_initiation_events: t.Dict[
+        int, "_history.StartChildWorkflowExecutionInitiatedEvent"
     ]
     _timers: t.Dict[int, TimerState]
     _latest_decision_event_id: int
     _could_be_new: t.List[
         t.Tuple[int, t.Union[DecisionFailure, SignalState, MarkerState]]
     ]
+    _event_processors: t.ClassVar[
+        t.Union[
+            t.Dict[
+                t.Type["_history.Event"],
+                t.Callable[["_StateBuilder", "_history.Event"], None],
+            ],
+            None,
+        ]
+    ] = None
 
     def __init__(self, execution_history: t.Iterable["_history.Event"]):
         """Initialise builder.
@@ -343,257 +354,485 @@ class _StateBuilder:
 
         self.execution_history = execution_history
         self._tasks = {}
+        self._tasks_by_id = {}
         self._child_executions = {}
-        self._child_execution_initiation_events = []
+        self._child_execution_initiation_events = {}
         self._timers = {}
         self._could_be_new = []
 
-    def _process_event(self, event: "_history.Event") -> None:
-        """Update workflow execution state with event."""
+    def _process_decision_task_completed_event(
+        self, event: "_history.DecisionTaskCompletedEvent"
+    ) -> None:
+        """Record most recent decision."""
+        self._latest_decision_event_id = event.id
+
+    def _process_decision_failed_event(self, event: "_history.Event") -> None:
+        """Record decision failure, possibly after most recent decision."""
+        decision_failure = DecisionFailure(event)
+        self.execution.decision_failures.append(decision_failure)
+        self._could_be_new.append((self._latest_decision_event_id, decision_failure))
+
+    def _process_execution_started_event(
+        self, event: "_history.WorkflowExecutionStartedEvent"
+    ) -> None:
+        """Initialise execution state from execution start."""
+        self.execution = ExecutionState(
+            status=_executions.ExecutionStatus.started,
+            configuration=event.execution_configuration,
+            started=event.occured,
+            input=event.execution_input,
+        )
+
+    def _process_execution_completed_event(
+        self, event: "_history.WorkflowExecutionCompletedEvent"
+    ) -> None:
+        """Record execution completion."""
+        self.execution.status = _executions.ExecutionStatus.completed
+        self.execution.ended = event.occured
+        self.execution.result = event.execution_result
+
+    def _process_execution_failed_event(
+        self, event: "_history.WorkflowExecutionFailedEvent"
+    ) -> None:
+        """Record execution failure."""
+        self.execution.status = _executions.ExecutionStatus.failed
+        self.execution.ended = event.occured
+        self.execution.failure_reason = event.reason
+        self.execution.stop_details = event.details
+
+    def _process_execution_cancelled_event(
+        self, event: "_history.WorkflowExecutionCancelledEvent"
+    ) -> None:
+        """Record execution cancellation."""
+        self.execution.status = _executions.ExecutionStatus.cancelled
+        self.execution.ended = event.occured
+        self.execution.stop_details = event.details
+
+    def _process_execution_terminated_event(
+        self, event: "_history.WorkflowExecutionTerminatedEvent"
+    ) -> None:
+        """Record execution termination."""
+        self.execution.status = _executions.ExecutionStatus.terminated
+        self.execution.ended = event.occured
+        self.execution.failure_reason = event.reason
+        self.execution.stop_details = event.details
+
+    def _process_execution_timed_out_event(
+        self, event: "_history.WorkflowExecutionTimedOutEvent"
+    ) -> None:
+        """Record execution time-out."""
+        self.execution.status = _executions.ExecutionStatus.timed_out
+        self.execution.ended = event.occured
+
+    def _process_execution_continued_as_new_event(
+        self, event: "_history.WorkflowExecutionContinuedAsNewEvent"
+    ) -> None:
+        """Record execution continuation as a new execution."""
+        self.execution.status = _executions.ExecutionStatus.continued_as_new
+        self.execution.ended = event.occured
+        self.execution.continuing_execution_run_id = event.execution_run_id
+
+    def _process_execution_cancel_requested_event(
+        self, event: "_history.WorkflowExecutionCancelRequestedEvent"
+    ) -> None:
+        """Record execution cancellation request."""
+        self.execution.cancel_requested = True
+
+    def _process_task_scheduled_event(
+        self, event: "_history.ActivityTaskScheduledEvent"
+    ) -> None:
+        """Record activity task scheduling."""
+        task = TaskState(
+            id=event.task_id,
+            status=TaskStatus.scheduled,
+            activity=event.activity,
+            configuration=event.task_configuration,
+            scheduled=event.occured,
+            input=event.task_input,
+            decider_control=event.control,
+        )
+        self.execution.tasks.append(task)
+        self._tasks[event.id] = task
+        self._tasks_by_id[event.task_id] = task
+
+    def _process_task_started_event(
+        self, event: "_history.ActivityTaskStartedEvent"
+    ) -> None:
+        """Record activity task start."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.started
+        task.started = event.occured
+        task.worker_identity = event.worker_identity
+
+    def _process_task_completed_event(
+        self, event: "_history.ActivityTaskCompletedEvent"
+    ) -> None:
+        """Record activity task completion."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.completed
+        task.ended = event.occured
+        task.result = event.task_result
+
+    def _process_task_failed_event(
+        self, event: "_history.ActivityTaskFailedEvent"
+    ) -> None:
+        """Record activity task failure."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.failed
+        task.ended = event.occured
+        task.failure_reason = event.reason
+        task.stop_details = event.details
+
+    def _process_task_cancelled_event(
+        self, event: "_history.ActivityTaskCancelledEvent"
+    ) -> None:
+        """Record activity task cancellation."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.cancelled
+        task.ended = event.occured
+        task.stop_details = event.details
+
+    def _process_task_timed_out_event(
+        self, event: "_history.ActivityTaskTimedOutEvent"
+    ) -> None:
+        """Record activity task time-out."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.timed_out
+        task.ended = event.occured
+        task.timeout_type = event.timeout_type
+        task.stop_details = event.details
+
+    def _process_task_cancel_requested_event(
+        self, event: "_history.ActivityTaskCancelRequestedEvent"
+    ) -> None:
+        """Record activity task cancellation request, by task ID."""
+        try:
+            task = self._tasks_by_id[event.task_id]
+        except KeyError:
+            raise LookupError(event.task_id) from None
+        task.cancel_requested = True
+
+    def _process_lambda_task_scheduled_event(
+        self, event: "_history.LambdaFunctionScheduledEvent"
+    ) -> None:
+        """Record Lambda task scheduling."""
+        task = LambdaTaskState(
+            id=event.task_id,
+            status=TaskStatus.scheduled,
+            lambda_function=event.lambda_function,
+            scheduled=event.occured,
+            timeout=event.task_timeout,
+            input=event.task_input,
+            decider_control=event.control,
+        )
+        self.execution.tasks.append(task)
+        self._tasks[event.id] = task
+
+    def _process_lambda_task_started_event(
+        self, event: "_history.LambdaFunctionStartedEvent"
+    ) -> None:
+        """Record Lambda task start."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.started
+        task.started = event.occured
+
+    def _process_lambda_task_completed_event(
+        self, event: "_history.LambdaFunctionCompletedEvent"
+    ) -> None:
+        """Record Lambda task completion."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.completed
+        task.ended = event.occured
+        task.result = event.task_result
+
+    def _process_lambda_task_failed_event(
+        self, event: "_history.LambdaFunctionFailedEvent"
+    ) -> None:
+        """Record Lambda task failure."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.failed
+        task.ended = event.occured
+        task.failure_reason = event.reason
+        task.stop_details = event.details
+
+    def _process_lambda_task_timed_out_event(
+        self, event: "_history.LambdaFunctionTimedOutEvent"
+    ) -> None:
+        """Record Lambda task time-out."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.timed_out
+        task.ended = event.occured
+
+    def _process_lambda_task_start_failed_event(
+        self, event: "_history.StartLambdaFunctionFailedEvent"
+    ) -> None:
+        """Record Lambda task failure to start."""
+        task = self._tasks[event.task_scheduled_event_id]
+        task.status = TaskStatus.failed
+
+    def _process_child_execution_initiated_event(
+        self, event: "_history.StartChildWorkflowExecutionInitiatedEvent"
+    ) -> None:
+        """Keep child execution initiation for when it starts."""
+        self._child_execution_initiation_events[event.id] = event
+
+    def _process_child_execution_started_event(
+        self, event: "_history.ChildWorkflowExecutionStartedEvent"
+    ) -> None:
+        """Record child execution start, from its initiation."""
+        try:
+            initiation_event = self._child_execution_initiation_events[
+                event.initiated_event_id
+            ]
+        except KeyError:
+            raise LookupError(event.initiated_event_id) from None
+
+        execution = ChildExecutionState(
+            execution=event.execution,
+            workflow=initiation_event.workflow,
+            status=_executions.ExecutionStatus.started,
+            configuration=initiation_event.execution_configuration,
+            started=event.occured,
+            input=initiation_event.execution_input,
+            decider_control=initiation_event.control,
+        )
+        self.execution.child_executions.append(execution)
+        self._child_executions[initiation_event.id] = execution
+
+    def _process_child_execution_completed_event(
+        self, event: "_history.ChildWorkflowExecutionCompletedEvent"
+    ) -> None:
+        """Record child execution completion."""
+        execution = self._child_executions[event.initiated_event_id]
+        execution.status = _executions.ExecutionStatus.completed
+        execution.ended = event.occured
+        execution.result = event.execution_result
+
+    def _process_child_execution_failed_event(
+        self, event: "_history.ChildWorkflowExecutionFailedEvent"
+    ) -> None:
+        """Record child execution failure."""
+        execution = self._child_executions[event.initiated_event_id]
+        execution.status = _executions.ExecutionStatus.failed
+        execution.ended = event.occured
+        execution.failure_reason = event.reason
+        execution.stop_details = event.details
+
+    def _process_child_execution_cancelled_event(
+        self, event: "_history.ChildWorkflowExecutionCancelledEvent"
+    ) -> None:
+        """Record child execution cancellation."""
+        execution = self._child_executions[event.initiated_event_id]
+        execution.status = _executions.ExecutionStatus.cancelled
+        execution.ended = event.occured
+        execution.stop_details = event.details
+
+    def _process_child_execution_terminated_event(
+        self, event: "_history.ChildWorkflowExecutionTerminatedEvent"
+    ) -> None:
+        """Record child execution termination."""
+        execution = self._child_executions[event.initiated_event_id]
+        execution.status = _executions.ExecutionStatus.terminated
+        execution.ended = event.occured
+
+    def _process_child_execution_timed_out_event(
+        self, event: "_history.ChildWorkflowExecutionTimedOutEvent"
+    ) -> None:
+        """Record child execution time-out."""
+        execution = self._child_executions[event.initiated_event_id]
+        execution.status = _executions.ExecutionStatus.terminated
+        execution.ended = event.occured
+
+    def _process_timer_started_event(
+        self, event: "_history.TimerStartedEvent"
+    ) -> None:
+        """Record timer start."""
+        timer = TimerState(
+            id=event.timer_id,
+            status=TimerStatus.started,
+            duraction=event.timer_duration,
+            started=event.occured,
+            decider_control=event.control,
+        )
+        self.execution.timers.append(timer)
+        self._timers[event.id] = timer
+
+    def _process_timer_fired_event(self, event: "_history.TimerFiredEvent") -> None:
+        """Record timer firing."""
+        timer = self._timers[event.timer_started_event_id]
+        timer.status = TimerStatus.fired
+        timer.ended = event.occured
+
+    def _process_timer_cancelled_event(
+        self, event: "_history.TimerCancelledEvent"
+    ) -> None:
+        """Record timer cancellation."""
+        timer = self._timers[event.timer_started_event_id]
+        timer.status = TimerStatus.cancelled
+        timer.ended = event.occured
+
+    def _process_signal_event(
+        self, event: "_history.WorkflowExecutionSignaledEvent"
+    ) -> None:
+        """Record execution signal, possibly after most recent decision."""
+        signal = SignalState(
+            name=event.signal_name,
+            received=event.occured,
+            input=event.signal_input,
+        )
+        self.execution.signals.append(signal)
+        self._could_be_new.append((self._latest_decision_event_id, signal))
+
+    def _process_marker_event(self, event: "_history.MarkerRecordedEvent") -> None:
+        """Record marker, possibly after most recent decision."""
+        marker = MarkerState(
+            name=event.marker_name,
+            recorded=event.occured,
+            details=event.details,
+        )
+        self.execution.markers.append(marker)
+        self._could_be_new.append((self._latest_decision_event_id, marker))
+
+    @classmethod
+    def _get_event_processors(cls) -> t.Dict[
+        t.Type["_history.Event"],
+        t.Callable[["_StateBuilder", "_history.Event"], None],
+    ]:
+        """Get state-updating methods by event type, mapped on first use."""
+        if cls._event_processors is not None:
+            return cls._event_processors
+
         from . import _history
-        from . import _executions
-
-        # Decisions
-        if isinstance(event, _history.DecisionTaskCompletedEvent):
-            self._latest_decision_event_id = event.id
-
-        elif (
-            isinstance(event, _history.CancelTimerFailedEvent) or
-            isinstance(event, _history.CancelWorkflowExecutionFailedEvent) or
-            isinstance(event, _history.CompleteWorkflowExecutionFailedEvent) or
-            isinstance(event, _history.ContinueAsNewWorkflowExecutionFailedEvent) or
-            isinstance(event, _history.FailWorkflowExecutionFailedEvent) or
-            isinstance(event, _history.RecordMarkerFailedEvent) or
-            isinstance(event, _history.RequestCancelActivityTaskFailedEvent) or
-            isinstance(
-                event, _history.RequestCancelExternalWorkflowExecutionFailedEvent
-            ) or
-            isinstance(event, _history.ScheduleActivityTaskFailedEvent) or
-            isinstance(event, _history.ScheduleLambdaFunctionFailedEvent) or
-            isinstance(event, _history.SignalExternalWorkflowExecutionFailedEvent) or
-            isinstance(event, _history.StartChildWorkflowExecutionFailedEvent) or
-            isinstance(event, _history.StartTimerFailedEvent)
-        ):
-            decision_failure = DecisionFailure(event)
-            self.execution.decision_failures.append(decision_failure)
-            self._could_be_new.append(
-                (self._latest_decision_event_id, decision_failure)
-            )
-
-        # Execution
-        elif isinstance(event, _history.WorkflowExecutionStartedEvent):
-            self.execution = ExecutionState(
-                status=_executions.ExecutionStatus.started,
-                configuration=event.execution_configuration,
-                started=event.occured,
-                input=event.execution_input,
-            )
-        elif isinstance(event, _history.WorkflowExecutionCompletedEvent):
-            self.execution.status = _executions.ExecutionStatus.completed
-            self.execution.ended = event.occured
-            self.execution.result = event.execution_result
-        elif isinstance(event, _history.WorkflowExecutionFailedEvent):
-            self.execution.status = _executions.ExecutionStatus.failed
-            self.execution.ended = event.occured
-            self.execution.failure_reason = event.reason
-            self.execution.stop_details = event.details
-        elif isinstance(event, _history.WorkflowExecutionCancelledEvent):
-            self.execution.status = _executions.ExecutionStatus.cancelled
-            self.execution.ended = event.occured
-            self.execution.stop_details = event.details
-        elif isinstance(event, _history.WorkflowExecutionTerminatedEvent):
-            self.execution.status = _executions.ExecutionStatus.terminated
-            self.execution.ended = event.occured
-            self.execution.failure_reason = event.reason
-            self.execution.stop_details = event.details
-        elif isinstance(event, _history.WorkflowExecutionTimedOutEvent):
-            self.execution.status = _executions.ExecutionStatus.timed_out
-            self.execution.ended = event.occured
-        elif isinstance(event, _history.WorkflowExecutionContinuedAsNewEvent):
-            self.execution.status = _executions.ExecutionStatus.continued_as_new
-            self.execution.ended = event.occured
-            self.execution.continuing_execution_run_id = event.execution_run_id
-
-        elif isinstance(event, _history.WorkflowExecutionCancelRequestedEvent):
-            self.execution.cancel_requested = True
-
-        # Tasks
-        elif isinstance(event, _history.ActivityTaskScheduledEvent):
-            task = TaskState(
-                id=event.task_id,
-                status=TaskStatus.scheduled,
-                activity=event.activity,
-                configuration=event.task_configuration,
-                scheduled=event.occured,
-                input=event.task_input,
-                decider_control=event.control,
-            )
-            self.execution.tasks.append(task)
-            self._tasks[event.id] = task
-        elif isinstance(event, _history.ActivityTaskStartedEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.started
-            task.started = event.occured
-            task.worker_identity = event.worker_identity
-        elif isinstance(event, _history.ActivityTaskCompletedEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.completed
-            task.ended = event.occured
-            task.result = event.task_result
-        elif isinstance(event, _history.ActivityTaskFailedEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.failed
-            task.ended = event.occured
-            task.failure_reason = event.reason
-            task.stop_details = event.details
-        elif isinstance(event, _history.ActivityTaskCancelledEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.cancelled
-            task.ended = event.occured
-            task.stop_details = event.details
-        elif isinstance(event, _history.ActivityTaskTimedOutEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.timed_out
-            task.ended = event.occured
-            task.timeout_type = event.timeout_type
-            task.stop_details = event.details
-
-        elif isinstance(event, _history.ActivityTaskCancelRequestedEvent):
-            tasks = (task for task in self.execution.tasks if task.id == event.task_id)
-            try:
-                task, = tasks
-            except ValueError:
-                raise LookupError(event.task_id) from None
-            task.cancel_requested = True
-
-        # elif isinstance(event, _history.StartActivityTaskFailedEvent):
-        #     task.status = TaskStatus.failed
-
-        # Lambda tasks
-        elif isinstance(event, _history.LambdaFunctionScheduledEvent):
-            task = LambdaTaskState(
-                id=event.task_id,
-                status=TaskStatus.scheduled,
-                lambda_function=event.lambda_function,
-                scheduled=event.occured,
-                timeout=event.task_timeout,
-                input=event.task_input,
-                decider_control=event.control,
-            )
-            self.execution.tasks.append(task)
-            self._tasks[event.id] = task
-        elif isinstance(event, _history.LambdaFunctionStartedEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.started
-            task.started = event.occured
-        elif isinstance(event, _history.LambdaFunctionCompletedEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.completed
-            task.ended = event.occured
-            task.result = event.task_result
-        elif isinstance(event, _history.LambdaFunctionFailedEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.failed
-            task.ended = event.occured
-            task.failure_reason = event.reason
-            task.stop_details = event.details
-        elif isinstance(event, _history.LambdaFunctionTimedOutEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.timed_out
-            task.ended = event.occured
-
-        elif isinstance(event, _history.StartLambdaFunctionFailedEvent):
-            task = self._tasks[event.task_scheduled_event_id]
-            task.status = TaskStatus.failed
-
-        # Child executions
-        elif isinstance(event, _history.StartChildWorkflowExecutionInitiatedEvent):
-            self._child_execution_initiation_events.append(event)
-        elif isinstance(event, _history.ChildWorkflowExecutionStartedEvent):
-            events = (
-                e for e in self._child_execution_initiation_events
-                if e.id == event.initiated_event_id
-            )
-            try:
-                initiation_event, = events
-            except ValueError:
-                raise LookupError(event.initiated_event_id) from None
-
-            execution = ChildExecutionState(
-                execution=event.execution,
-                workflow=initiation_event.workflow,
-                status=_executions.ExecutionStatus.started,
-                configuration=initiation_event.execution_configuration,
-                started=event.occured,
-                input=initiation_event.execution_input,
-                decider_control=initiation_event.control,
-            )
-            self.execution.child_executions.append(execution)
-            self._child_executions[initiation_event.id] = execution
-        elif isinstance(event, _history.ChildWorkflowExecutionCompletedEvent):
-            execution = self._child_executions[event.initiated_event_id]
-            execution.status = _executions.ExecutionStatus.completed
-            execution.ended = event.occured
-            execution.result = event.execution_result
-        elif isinstance(event, _history.ChildWorkflowExecutionFailedEvent):
-            execution = self._child_executions[event.initiated_event_id]
-            execution.status = _executions.ExecutionStatus.failed
-            execution.ended = event.occured
-            execution.failure_reason = event.reason
-            execution.stop_details = event.details
-        elif isinstance(event, _history.ChildWorkflowExecutionCancelledEvent):
-            execution = self._child_executions[event.initiated_event_id]
-            execution.status = _executions.ExecutionStatus.cancelled
-            execution.ended = event.occured
-            execution.stop_details = event.details
-        elif isinstance(event, _history.ChildWorkflowExecutionTerminatedEvent):
-            execution = self._child_executions[event.initiated_event_id]
-            execution.status = _executions.ExecutionStatus.terminated
-            execution.ended = event.occured
-        elif isinstance(event, _history.ChildWorkflowExecutionTimedOutEvent):
-            execution = self._child_executions[event.initiated_event_id]
-            execution.status = _executions.ExecutionStatus.terminated
-            execution.ended = event.occured
-
-        # Timers
-        elif isinstance(event, _history.TimerStartedEvent):
-            timer = TimerState(
-                id=event.timer_id,
-                status=TimerStatus.started,
-                duraction=event.timer_duration,
-                started=event.occured,
-                decider_control=event.control,
-            )
-            self.execution.timers.append(timer)
-            self._timers[event.id] = timer
-        elif isinstance(event, _history.TimerFiredEvent):
-            timer = self._timers[event.timer_started_event_id]
-            timer.status = TimerStatus.fired
-            timer.ended = event.occured
-        elif isinstance(event, _history.TimerCancelledEvent):
-            timer = self._timers[event.timer_started_event_id]
-            timer.status = TimerStatus.cancelled
-            timer.ended = event.occured
-
-        # Signals
-        elif isinstance(event, _history.WorkflowExecutionSignaledEvent):
-            signal = SignalState(
-                name=event.signal_name,
-                received=event.occured,
-                input=event.signal_input,
-            )
-            self.execution.signals.append(signal)
-            self._could_be_new.append((self._latest_decision_event_id, signal))
-
-        # Markers
-        elif isinstance(event, _history.MarkerRecordedEvent):
-            marker = MarkerState(
-                name=event.marker_name,
-                recorded=event.occured,
-                details=event.details,
-            )
-            self.execution.markers.append(marker)
-            self._could_be_new.append((self._latest_decision_event_id, marker))
+
+        cls._event_processors = {
+            # Decisions
+            _history.DecisionTaskCompletedEvent: (
+                cls._process_decision_task_completed_event
+            ),
+            _history.CancelTimerFailedEvent: cls._process_decision_failed_event,
+            _history.CancelWorkflowExecutionFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.CompleteWorkflowExecutionFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.ContinueAsNewWorkflowExecutionFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.FailWorkflowExecutionFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.RecordMarkerFailedEvent: cls._process_decision_failed_event,
+            _history.RequestCancelActivityTaskFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.RequestCancelExternalWorkflowExecutionFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.ScheduleActivityTaskFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.ScheduleLambdaFunctionFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.SignalExternalWorkflowExecutionFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.StartChildWorkflowExecutionFailedEvent: (
+                cls._process_decision_failed_event
+            ),
+            _history.StartTimerFailedEvent: cls._process_decision_failed_event,
+
+            # Execution
+            _history.WorkflowExecutionStartedEvent: (
+                cls._process_execution_started_event
+            ),
+            _history.WorkflowExecutionCompletedEvent: (
+                cls._process_execution_completed_event
+            ),
+            _history.WorkflowExecutionFailedEvent: (
+                cls._process_execution_failed_event
+            ),
+            _history.WorkflowExecutionCancelledEvent: (
+                cls._process_execution_cancelled_event
+            ),
+            _history.WorkflowExecutionTerminatedEvent: (
+                cls._process_execution_terminated_event
+            ),
+            _history.WorkflowExecutionTimedOutEvent: (
+                cls._process_execution_timed_out_event
+            ),
+            _history.WorkflowExecutionContinuedAsNewEvent: (
+                cls._process_execution_continued_as_new_event
+            ),
+            _history.WorkflowExecutionCancelRequestedEvent: (
+                cls._process_execution_cancel_requested_event
+            ),
+
+            # Tasks
+            _history.ActivityTaskScheduledEvent: cls._process_task_scheduled_event,
+            _history.ActivityTaskStartedEvent: cls._process_task_started_event,
+            _history.ActivityTaskCompletedEvent: cls._process_task_completed_event,
+            _history.ActivityTaskFailedEvent: cls._process_task_failed_event,
+            _history.ActivityTaskCancelledEvent: cls._process_task_cancelled_event,
+            _history.ActivityTaskTimedOutEvent: cls._process_task_timed_out_event,
+            _history.ActivityTaskCancelRequestedEvent: (
+                cls._process_task_cancel_requested_event
+            ),
+
+            # Lambda tasks
+            _history.LambdaFunctionScheduledEvent: (
+                cls._process_lambda_task_scheduled_event
+            ),
+            _history.LambdaFunctionStartedEvent: (
+                cls._process_lambda_task_started_event
+            ),
+            _history.LambdaFunctionCompletedEvent: (
+                cls._process_lambda_task_completed_event
+            ),
+            _history.LambdaFunctionFailedEvent: cls._process_lambda_task_failed_event,
+            _history.LambdaFunctionTimedOutEvent: (
+                cls._process_lambda_task_timed_out_event
+            ),
+            _history.StartLambdaFunctionFailedEvent: (
+                cls._process_lambda_task_start_failed_event
+            ),
+
+            # Child executions
+            _history.StartChildWorkflowExecutionInitiatedEvent: (
+                cls._process_child_execution_initiated_event
+            ),
+            _history.ChildWorkflowExecutionStartedEvent: (
+                cls._process_child_execution_started_event
+            ),
+            _history.ChildWorkflowExecutionCompletedEvent: (
+                cls._process_child_execution_completed_event
+            ),
+            _history.ChildWorkflowExecutionFailedEvent: (
+                cls._process_child_execution_failed_event
+            ),
+            _history.ChildWorkflowExecutionCancelledEvent: (
+                cls._process_child_execution_cancelled_event
+            ),
+            _history.ChildWorkflowExecutionTerminatedEvent: (
+                cls._process_child_execution_terminated_event
+            ),
+            _history.ChildWorkflowExecutionTimedOutEvent: (
+                cls._process_child_execution_timed_out_event
+            ),
+
+            # Timers
+            _history.TimerStartedEvent: cls._process_timer_started_event,
+            _history.TimerFiredEvent: cls._process_timer_fired_event,
+            _history.TimerCancelledEvent: cls._process_timer_cancelled_event,
+
+            # Signals
+            _history.WorkflowExecutionSignaledEvent: cls._process_signal_event,
+
+            # Markers
+            _history.MarkerRecordedEvent: cls._process_marker_event,
+        }
+        return cls._event_processors
 
     def _update_is_new(self) -> None:
         """Mark execution state which happended after last decision."""
@@ -602,8 +841,11 @@ class _StateBuilder:
 
     def build(self) -> None:
         """Build workflow execution state."""
+        event_processors = self._get_event_processors()
         for event in self.execution_history:
-            self._process_event(event)
+            process_event = event_processors.get(type(event))
+            if process_event:
+                process_event(self, event)
         self._update_is_new()
 
 
@@ -11,11 +11,28 @@ from . import _executions
 if t.TYPE_CHECKING:
     import botocore.client
 
+_default_execution_configuration_keys = {
+    k: "default" + k[0].upper() + k[1:]
+    for k in (
+        "executionStartToCloseTimeout",
+        "taskStartToCloseTimeout",
+        "taskList",
+        "taskPriority",
+        "childPolicy",
+        "lambdaRole",
+    )
+}
+_execution_configuration_keys_by_default_key = {
+    v: k for k, v in _default_execution_configuration_keys.items()
+}
+
 
 @dataclasses.dataclass
 class WorkflowId(_common.Deserialisable, _common.Serialisable):
     """Workflow type identifier."""
 
+    __slots__ = ("name", "version")
+
     name: str
     """Workflow name."""
 
@@ -65,18 +82,24 @@ class DefaultExecutionConfiguration(_executions.PartialExecutionConfiguration):
 
     @classmethod
     def from_api(cls, data) -> "DefaultExecutionConfiguration":
-        data = {k[7].lower() + k[8:]: v for k, v in data.items()}
+        data = {
+            k: data[default_k]
+            for default_k, k in _execution_configuration_keys_by_default_key.items()
+            if default_k in data
+        }
         return super().from_api(data)
 
     def get_api_args(self):
         kw = super().get_api_args()
-        return {"default" + k[0].upper() + k[1:]: v for k, v in kw.items()}
+        return {_default_execution_configuration_keys[k]: v for k, v in kw.items()}
 
 
 @dataclasses.dataclass
 class WorkflowDetails(_common.Deserialisable):
     """Workflow type details and default workflow execution configuration."""
 
+    __slots__ = ("info", "default_execution_configuration")
+
     info: WorkflowInfo
     """Workflow details."""
 
@@ -96,6 +119,8 @@ class WorkflowDetails(_common.Deserialisable):
 class WorkflowIdFilter(_common.Serialisable, _common.SerialisableToArguments):
     """Workflow type filter on workflow name."""
 
+    __slots__ = ("name",)
+
     name: str
     """Workflow name."""
 
@@ -200,10 +225,9 @@ def register_workflow(
     """
 
     client = _common.ensure_client(client)
-    default_execution_configuration = (
-        default_execution_configuration or DefaultExecutionConfiguration()
-    )
-    kw = default_execution_configuration.get_api_args()
+    kw = {}
+    if default_execution_configuration:
+        kw = default_execution_configuration.get_api_args()
     if description or description == "":
         kw["description"] = description
     client.register_workflow_type(
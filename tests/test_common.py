@@ -0,0 +1,59 @@
+"""Test ``swf_typed._common``."""
+
+import os
+import signal
+
+import pytest
+
+from swf_typed import _common
+
+
+def _call(nextPageToken: str = None):
+    page = int(nextPageToken or 0)
+    response = {"items": [page * 2, page * 2 + 1]}
+    if page < 2:
+        response["nextPageToken"] = str(page + 1)
+    return response
+
+
+def test_iter_paged():
+    assert list(_common.iter_paged(_call, str, "items")) == list("012345")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_iter_paged_after_fork():
+    assert list(_common.iter_paged(_call, str, "items")) == list("012345")
+
+    pid = os.fork()
+    if pid == 0:  # child
+        exit_code = 1
+        try:
+            signal.alarm(10)
+            if list(_common.iter_paged(_call, str, "items")) == list("012345"):
+                exit_code = 0
+        finally:
+            os._exit(exit_code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_default_client_after_fork(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    parent_client = _common.ensure_client()
+
+    pid = os.fork()
+    if pid == 0:  # child
+        exit_code = 1
+        try:
+            signal.alarm(10)
+            client = _common.ensure_client()
+            if client is not parent_client and _common.ensure_client() is client:
+                exit_code = 0
+        finally:
+            os._exit(exit_code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    assert _common.ensure_client() is parent_client